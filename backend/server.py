@@ -1,7 +1,10 @@
+import logging
+
 from flask import Flask, jsonify
 import win32com.client
 
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
 
 def open_excel():
     try:
@@ -9,6 +12,7 @@ def open_excel():
         excel.Visible = True
         return {"message": "Excel opened successfully"}
     except Exception as e:
+        logger.exception("Error opening Excel")
         return {"error": str(e)}
 
 @app.route('/open-excel', methods=['GET'])